@@ -1,427 +1,527 @@
 #!/usr/bin/env python3
 import os
+import sys
 import hashlib
 
-def generate_uuid(salt=''):
-    """Generate a 24-character hex ID similar to Xcode's format"""
-    h = hashlib.md5(salt.encode()).hexdigest()
-    return h[:24].upper()
-
-# Get all Swift files
-swift_files = []
-for root, dirs, files in os.walk('.'):
-    # Skip build directories and SPM
-    dirs[:] = [d for d in dirs if d not in ['Sources', '.build', 'Tonic.xcodeproj', '.swiftpm']]
-    for f in files:
-        if f.endswith('.swift') and f != 'Package.swift':
-            rel_path = os.path.join(root, f).lstrip('./')
-            swift_files.append(rel_path)
+def generate_uuid(salt=b''):
+    """Generate a 24-character hex ID similar to Xcode's format from a bytes salt"""
+    return hashlib.blake2b(salt, digest_size=12, usedforsecurity=False).hexdigest().upper()
+
+# Static section templates; IDs are filled in with str.format at emission time,
+# templates without fields (single braces) are written as-is
+FILE_HEADER = """\
+// !$*UTF8*$!
+{
+\tarchiveVersion = 1;
+\tclasses = {
+\t};
+\tobjectVersion = 56;
+\tobjects = {
+"""
+
+FRAMEWORKS_PHASE_SECTION = """\
+/* Begin PBXFrameworksBuildPhase section */
+\t\t{frameworks_phase_id} /* Frameworks */ = {{
+\t\t\tisa = PBXFrameworksBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXFrameworksBuildPhase section */
+"""
+
+GROUP_SECTION_HEAD = """\
+/* Begin PBXGroup section */
+\t\t{main_group_id} = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t{tonic_group_id} /* Tonic */,
+\t\t\t\t{products_group_id} /* Products */,
+\t\t\t);
+\t\t\tsourceTree = "<group>";
+\t\t}};
+\t\t{products_group_id} /* Products */ = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t{app_ref_id} /* Tonic.app */,
+\t\t\t);
+\t\t\tname = Products;
+\t\t\tsourceTree = "<group>";
+\t\t}};
+\t\t{tonic_group_id} /* Tonic */ = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+\t\t\t\t{models_group} /* Models */,
+\t\t\t\t{views_group} /* Views */,
+\t\t\t\t{utils_group} /* Utilities */,
+\t\t\t\t{services_group} /* Services */,
+\t\t\t\t{design_group} /* Design */,
+"""
+
+TONIC_GROUP_TAIL = """\
+\t\t\t);
+\t\t\tpath = Tonic;
+\t\t\tsourceTree = "<group>";
+\t\t};
+"""
+
+SUBGROUP_HEAD = """\
+\t\t{group_id} /* {name} */ = {{
+\t\t\tisa = PBXGroup;
+\t\t\tchildren = (
+"""
+
+SUBGROUP_TAIL = """\
+\t\t\t);
+\t\t\tpath = {name};
+\t\t\tsourceTree = "<group>";
+\t\t}};
+"""
+
+NATIVE_TARGET_SECTION = """\
+/* Begin PBXNativeTarget section */
+\t\t{target_id} /* Tonic */ = {{
+\t\t\tisa = PBXNativeTarget;
+\t\t\tbuildConfigurationList = {target_config_list_id} /* Build configuration list for PBXNativeTarget "Tonic" */;
+\t\t\tbuildPhases = (
+\t\t\t\t{sources_phase_id} /* Sources */,
+\t\t\t\t{frameworks_phase_id} /* Frameworks */,
+\t\t\t\t{resources_phase_id} /* Resources */,
+\t\t\t);
+\t\t\tbuildRules = (
+\t\t\t);
+\t\t\tdependencies = (
+\t\t\t);
+\t\t\tname = Tonic;
+\t\t\tproductName = Tonic;
+\t\t\tproductReference = {app_ref_id} /* Tonic.app */;
+\t\t\tproductType = "com.apple.product-type.application";
+\t\t}};
+/* End PBXNativeTarget section */
+"""
+
+PROJECT_SECTION = """\
+/* Begin PBXProject section */
+\t\t{project_id} /* Project object */ = {{
+\t\t\tisa = PBXProject;
+\t\t\tattributes = {{
+\t\t\t\tBuildIndependentTargetsInParallel = 1;
+\t\t\t\tLastSwiftUpdateCheck = 1500;
+\t\t\t\tLastUpgradeCheck = 1500;
+\t\t\t\tTargetAttributes = {{
+\t\t\t\t\t{target_id} = {{
+\t\t\t\t\t\tCreatedOnToolsVersion = 15.0;
+\t\t\t\t\t\tSystemCapabilities = {{
+\t\t\t\t\t\t\tcom.apple.Sandbox = {{
+\t\t\t\t\t\t\t\tenabled = 0;
+\t\t\t\t\t\t\t}};
+\t\t\t\t\t\t}};
+\t\t\t\t\t}};
+\t\t\t\t}};
+\t\t\t}};
+\t\t\tbuildConfigurationList = {config_list_id} /* Build configuration list for PBXProject "Tonic" */;
+\t\t\tcompatibilityVersion = "Xcode 14.0";
+\t\t\tdevelopmentRegion = en;
+\t\t\thasScannedForEncodings = 0;
+\t\t\tknownRegions = (
+\t\t\t\ten,
+\t\t\t\tBase,
+\t\t\t);
+\t\t\tmainGroup = {main_group_id};
+\t\t\tproductRefGroup = {products_group_id};
+\t\t\tprojectDirPath = "";
+\t\t\tprojectRoot = "";
+\t\t\ttargets = (
+\t\t\t\t{target_id} /* Tonic */,
+\t\t\t);
+\t\t}};
+/* End PBXProject section */
+"""
+
+RESOURCES_PHASE_SECTION = """\
+/* Begin PBXResourcesBuildPhase section */
+\t\t{resources_phase_id} /* Resources */ = {{
+\t\t\tisa = PBXResourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t}};
+/* End PBXResourcesBuildPhase section */
+"""
+
+SOURCES_PHASE_HEAD = """\
+/* Begin PBXSourcesBuildPhase section */
+\t\t{sources_phase_id} /* Sources */ = {{
+\t\t\tisa = PBXSourcesBuildPhase;
+\t\t\tbuildActionMask = 2147483647;
+\t\t\tfiles = (
+"""
+
+SOURCES_PHASE_TAIL = """\
+\t\t\t);
+\t\t\trunOnlyForDeploymentPostprocessing = 0;
+\t\t};
+/* End PBXSourcesBuildPhase section */
+"""
+
+CONFIG_LISTS_SECTION = """\
+/* Begin XCConfigurationList section */
+\t\t{config_list_id} /* Build configuration list for PBXProject "Tonic" */ = {{
+\t\t\tisa = XCConfigurationList;
+\t\t\tbuildConfigurations = (
+\t\t\t\t{debug_proj_id} /* Debug */,
+\t\t\t\t{release_proj_id} /* Release */,
+\t\t\t);
+\t\t\tdefaultConfigurationIsVisible = 0;
+\t\t\tdefaultConfigurationName = Release;
+\t\t}};
+\t\t{target_config_list_id} /* Build configuration list for PBXNativeTarget "Tonic" */ = {{
+\t\t\tisa = XCConfigurationList;
+\t\t\tbuildConfigurations = (
+\t\t\t\t{debug_target_id} /* Debug */,
+\t\t\t\t{release_target_id} /* Release */,
+\t\t\t);
+\t\t\tdefaultConfigurationIsVisible = 0;
+\t\t\tdefaultConfigurationName = Release;
+\t\t}};
+/* End XCConfigurationList section */
+"""
+
+FILE_FOOTER = """\
+\t}};
+\trootObject = {project_id} /* Project object */;
+}}
+"""
+
+DEBUG_PROJ_CFG = """\
+\t\t{uuid} /* Debug */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;
+\t\t\t\tASSETCATALOG_COMPILER_GENERATE_SWIFT_ASSET_SYMBOL_EXTENSIONS = YES;
+\t\t\t\tCLANG_ANALYZER_NONNULL = YES;
+\t\t\t\tCLANG_CXX_LANGUAGE_STANDARD = "gnu++20";
+\t\t\t\tCLANG_ENABLE_MODULES = YES;
+\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;
+\t\t\t\tCLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;
+\t\t\t\tCOPY_PHASE_STRIP = NO;
+\t\t\t\tDEBUG_INFORMATION_FORMAT = dwarf;
+\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;
+\t\t\t\tENABLE_TESTABILITY = YES;
+\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu17;
+\t\t\t\tGCC_NO_COMMON_BLOCKS = YES;
+\t\t\t\tGCC_WARN_64_TO_32_BIT_CONVERSION = YES;
+\t\t\t\tGCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;
+\t\t\t\tGCC_WARN_UNDECLARED_SELECTOR = YES;
+\t\t\t\tMACOSX_DEPLOYMENT_TARGET = 14.0;
+\t\t\t\tMTL_ENABLE_DEBUG_INFO = INCLUDE_SOURCE;
+\t\t\t\tONLY_ACTIVE_ARCH = YES;
+\t\t\t\tSDKROOT = macosx;
+\t\t\t\tSWIFT_ACTIVE_COMPILATION_CONDITIONS = "DEBUG $(inherited)";
+\t\t\t\tSWIFT_OPTIMIZATION_LEVEL = "-Onone";
+\t\t\t}};
+\t\t\tname = Debug;
+\t\t}};
+"""
+
+RELEASE_PROJ_CFG = """\
+\t\t{uuid} /* Release */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;
+\t\t\t\tASSETCATALOG_COMPILER_GENERATE_SWIFT_ASSET_SYMBOL_EXTENSIONS = YES;
+\t\t\t\tCLANG_ANALYZER_NONNULL = YES;
+\t\t\t\tCLANG_CXX_LANGUAGE_STANDARD = "gnu++20";
+\t\t\t\tCLANG_ENABLE_MODULES = YES;
+\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;
+\t\t\t\tCLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;
+\t\t\t\tCOPY_PHASE_STRIP = NO;
+\t\t\t\tDEBUG_INFORMATION_FORMAT = "dwarf-with-dsym";
+\t\t\t\tENABLE_NS_ASSERTIONS = NO;
+\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;
+\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu17;
+\t\t\t\tGCC_NO_COMMON_BLOCKS = YES;
+\t\t\t\tGCC_WARN_64_TO_32_BIT_CONVERSION = YES;
+\t\t\t\tGCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;
+\t\t\t\tGCC_WARN_UNDECLARED_SELECTOR = YES;
+\t\t\t\tMACOSX_DEPLOYMENT_TARGET = 14.0;
+\t\t\t\tMTL_ENABLE_DEBUG_INFO = NO;
+\t\t\t\tSDKROOT = macosx;
+\t\t\t\tSWIFT_COMPILATION_MODE = wholemodule;
+\t\t\t}};
+\t\t\tname = Release;
+\t\t}};
+"""
+
+DEBUG_TARGET_CFG = """\
+\t\t{uuid} /* Debug */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+\t\t\t\tASSETCATALOG_COMPILER_APPICON_NAME = AppIcon;
+\t\t\t\tASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME = AccentColor;
+\t\t\t\tCODE_SIGN_ENTITLEMENTS = Tonic/Tonic.entitlements;
+\t\t\t\tCODE_SIGN_STYLE = Automatic;
+\t\t\t\tCOMBINE_HIDPI_IMAGES = YES;
+\t\t\t\tCURRENT_PROJECT_VERSION = 1;
+\t\t\t\tDEVELOPMENT_TEAM = "";
+\t\t\t\tENABLE_HARDENED_RUNTIME = NO;
+\t\t\t\tENABLE_PREVIEWS = YES;
+\t\t\t\tGENERATE_INFOPLIST_FILE = YES;
+\t\t\t\tINFOPLIST_KEY_CFBundleDisplayName = "Tonic for Mac";
+\t\t\t\tINFOPLIST_KEY_LSApplicationCategoryType = "public.app-category.utilities";
+\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = "";
+\t\t\t\tLD_RUNPATH_SEARCH_PATHS = (
+\t\t\t\t\t"$(inherited)",
+\t\t\t\t\t"@executable_path/../Frameworks",
+\t\t\t\t);
+\t\t\t\tMACOSX_DEPLOYMENT_TARGET = 14.0;
+\t\t\t\tMARKETING_VERSION = 0.1.0;
+\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = com.tonicformac.app;
+\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME)";
+\t\t\t\tSDKROOT = macosx;
+\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;
+\t\t\t\tSWIFT_VERSION = 5.0;
+\t\t\t}};
+\t\t\tname = Debug;
+\t\t}};
+"""
+
+RELEASE_TARGET_CFG = """\
+\t\t{uuid} /* Release */ = {{
+\t\t\tisa = XCBuildConfiguration;
+\t\t\tbuildSettings = {{
+\t\t\t\tASSETCATALOG_COMPILER_APPICON_NAME = AppIcon;
+\t\t\t\tASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME = AccentColor;
+\t\t\t\tCODE_SIGN_ENTITLEMENTS = Tonic/Tonic.entitlements;
+\t\t\t\tCODE_SIGN_STYLE = Automatic;
+\t\t\t\tCOMBINE_HIDPI_IMAGES = YES;
+\t\t\t\tCURRENT_PROJECT_VERSION = 1;
+\t\t\t\tDEVELOPMENT_TEAM = "";
+\t\t\t\tENABLE_HARDENED_RUNTIME = NO;
+\t\t\t\tENABLE_PREVIEWS = YES;
+\t\t\t\tGENERATE_INFOPLIST_FILE = YES;
+\t\t\t\tINFOPLIST_KEY_CFBundleDisplayName = "Tonic for Mac";
+\t\t\t\tINFOPLIST_KEY_LSApplicationCategoryType = "public.app-category.utilities";
+\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = "";
+\t\t\t\tLD_RUNPATH_SEARCH_PATHS = (
+\t\t\t\t\t"$(inherited)",
+\t\t\t\t\t"@executable_path/../Frameworks",
+\t\t\t\t);
+\t\t\t\tMACOSX_DEPLOYMENT_TARGET = 14.0;
+\t\t\t\tMARKETING_VERSION = 0.1.0;
+\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = com.tonicformac.app;
+\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME)";
+\t\t\t\tSDKROOT = macosx;
+\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;
+\t\t\t\tSWIFT_VERSION = 5.0;
+\t\t\t}};
+\t\t\tname = Release;
+\t\t}};
+"""
+
+# Build directories and SPM folders that are never descended into
+EXCLUDED_DIRS = {'Sources', '.build', 'Tonic.xcodeproj', '.swiftpm'}
+
+PBXPROJ_PATH = 'Tonic.xcodeproj/project.pbxproj'
+# Signature of the last successful run: input hash and hash of the written pbxproj
+SIG_PATH = 'Tonic.xcodeproj/.swift_files.sig'
+
+def find_swift_files(prefix=''):
+    """Yield (relative path, filename) for Swift sources, pruning excluded directories"""
+    try:
+        entries = os.scandir(prefix or '.')
+    except OSError:
+        # Skip unreadable directories, as os.walk did
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDED_DIRS:
+                    yield from find_swift_files(prefix + entry.name + '/')
+            elif entry.name.endswith('.swift') and entry.name != 'Package.swift':
+                yield prefix + entry.name, entry.name
+
+def file_group(path):
+    """Return the second path component, '_top' for files directly in Tonic/, else None"""
+    parts = path.split('/', 2)
+    if len(parts) > 2:
+        return parts[1]
+    if len(parts) == 2 and parts[0] == 'Tonic':
+        return '_top'
+    return None
+
+def hash_file(path):
+    """Return the blake2b hex digest of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), usedforsecurity=False).hexdigest()
+
+def emit_group(out, group_id, name, files, refs):
+    """Write a PBXGroup whose children are the given (path, filename) files"""
+    out.write(SUBGROUP_HEAD.format(group_id=group_id, name=name))
+    out.writelines(f'\t\t\t\t{refs[f]} /* {fname} */,\n' for f, fname in files)
+    out.write(SUBGROUP_TAIL.format(name=name))
+
+# Get all Swift files as (path, filename, group)
+swift_files = [(f, name, file_group(f)) for f, name in find_swift_files()]
 
 swift_files.sort()
 
+# Skip regeneration when neither the file list nor this script has changed and
+# project.pbxproj is still the file the last run wrote; pass --force to always regenerate
+with open(__file__, 'rb') as src:
+    sig_hash = hashlib.blake2b(src.read(), usedforsecurity=False)
+sig_hash.update('\n'.join(f for f, _, _ in swift_files).encode())
+sig = sig_hash.hexdigest()
+if '--force' not in sys.argv[1:] and os.path.exists(PBXPROJ_PATH) and os.path.exists(SIG_PATH):
+    with open(SIG_PATH) as f:
+        stored = f.read().split()
+    if stored == [sig, hash_file(PBXPROJ_PATH)]:
+        print("project.pbxproj is up to date with " + str(len(swift_files)) + " Swift files")
+        sys.exit(0)
+
+# Bucket files by their Tonic/ subgroup in a single pass
+groups = {'Models': [], 'Views': [], 'Utilities': [], 'Services': [], 'Design': [], '_top': []}
+for f, name, top in swift_files:
+    if top in groups:
+        groups[top].append((f, name))
+
 # Generate unique IDs
-project_id = generate_uuid('project')
-main_group_id = generate_uuid('mainGroup')
-target_id = generate_uuid('target')
-products_group_id = generate_uuid('products')
-sources_phase_id = generate_uuid('sources')
-resources_phase_id = generate_uuid('resources')
-frameworks_phase_id = generate_uuid('frameworks')
-app_ref_id = generate_uuid('app')
-config_list_id = generate_uuid('configlist')
-target_config_list_id = generate_uuid('targetconfiglist')
-
-# Generate file reference IDs
-file_refs = {}
-build_files = {}
-for f in swift_files:
-    ref_id = generate_uuid(f'file_{f}')
-    file_refs[f] = ref_id
-    bf_id = generate_uuid(f'build_{f}')
-    build_files[f] = bf_id
-
-# Start generating pbxproj
-output = []
-output.append('// !$*UTF8*$!')
-output.append('{')
-output.append('\tarchiveVersion = 1;')
-output.append('\tclasses = {')
-output.append('\t};')
-output.append('\tobjectVersion = 56;')
-output.append('\tobjects = {')
-
-# PBXBuildFile section
-output.append('/* Begin PBXBuildFile section */')
-for f in swift_files:
-    output.append(f'\t\t{build_files[f]} /* {os.path.basename(f)} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_refs[f]} /* {os.path.basename(f)} */; }};')
-output.append('/* End PBXBuildFile section */')
-
-# PBXFileReference section
-output.append('/* Begin PBXFileReference section */')
-output.append(f'\t\t{app_ref_id} /* Tonic.app */ = {{isa = PBXFileReference; explicitFileType = wrapper.application; includeInIndex = 0; path = Tonic.app; sourceTree = BUILT_PRODUCTS_DIR; }};')
-for f in swift_files:
+project_id = generate_uuid(b'project')
+main_group_id = generate_uuid(b'mainGroup')
+target_id = generate_uuid(b'target')
+products_group_id = generate_uuid(b'products')
+sources_phase_id = generate_uuid(b'sources')
+resources_phase_id = generate_uuid(b'resources')
+frameworks_phase_id = generate_uuid(b'frameworks')
+app_ref_id = generate_uuid(b'app')
+config_list_id = generate_uuid(b'configlist')
+target_config_list_id = generate_uuid(b'targetconfiglist')
+tonic_group_id = generate_uuid(b'tonicgroup')
+debug_proj_id = generate_uuid(b'debug_proj')
+release_proj_id = generate_uuid(b'release_proj')
+debug_target_id = generate_uuid(b'debug_target')
+release_target_id = generate_uuid(b'release_target')
+models_group = generate_uuid(b'models')
+views_group = generate_uuid(b'views')
+utils_group = generate_uuid(b'utils')
+services_group = generate_uuid(b'services')
+design_group = generate_uuid(b'design')
+
+# Generate file reference and build file IDs from one 24-byte digest per file
+digests = [(f, hashlib.blake2b(f.encode(), digest_size=24, usedforsecurity=False).digest()) for f, _, _ in swift_files]
+file_refs = {f: d[:12].hex().upper() for f, d in digests}
+build_files = {f: d[12:].hex().upper() for f, d in digests}
+
+# Start generating pbxproj, streaming each section straight to disk
+os.makedirs('Tonic.xcodeproj', exist_ok=True)
+# Drop the old signature first so an interrupted run is never taken as up to date
+if os.path.exists(SIG_PATH):
+    os.remove(SIG_PATH)
+with open(PBXPROJ_PATH, 'w', buffering=1 << 20) as fh:
+    w = fh.write
+    w(FILE_HEADER)
+
+    # PBXBuildFile section
+    w('/* Begin PBXBuildFile section */\n')
+    fh.writelines(f'\t\t{build_files[f]} /* {name} in Sources */ = {{isa = PBXBuildFile; fileRef = {file_refs[f]} /* {name} */; }};\n' for f, name, _ in swift_files)
+    w('/* End PBXBuildFile section */\n')
+
+    # PBXFileReference section
+    w('/* Begin PBXFileReference section */\n')
+    w(f'\t\t{app_ref_id} /* Tonic.app */ = {{isa = PBXFileReference; explicitFileType = wrapper.application; includeInIndex = 0; path = Tonic.app; sourceTree = BUILT_PRODUCTS_DIR; }};\n')
     # For files in subgroups, use just the filename as the path
     # The parent group's path attribute will resolve the full path
-    output.append(f'\t\t{file_refs[f]} /* {os.path.basename(f)} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = "{os.path.basename(f)}"; sourceTree = "<group>"; }};')
-output.append('/* End PBXFileReference section */')
-
-# PBXFrameworksBuildPhase
-output.append('/* Begin PBXFrameworksBuildPhase section */')
-output.append(f'\t\t{frameworks_phase_id} /* Frameworks */ = {{')
-output.append('\t\t\tisa = PBXFrameworksBuildPhase;')
-output.append('\t\t\tbuildActionMask = 2147483647;')
-output.append('\t\t\tfiles = (')
-output.append('\t\t\t);')
-output.append('\t\t\trunOnlyForDeploymentPostprocessing = 0;')
-output.append('\t\t};')
-output.append('/* End PBXFrameworksBuildPhase section */')
-
-# PBXGroup section
-output.append('/* Begin PBXGroup section */')
-output.append(f'\t\t{main_group_id} = {{')
-output.append('\t\t\tisa = PBXGroup;')
-output.append('\t\t\tchildren = (')
-output.append(f'\t\t\t\t{generate_uuid("tonicgroup")} /* Tonic */,')
-output.append(f'\t\t\t\t{products_group_id} /* Products */,')
-output.append('\t\t\t);')
-output.append('\t\t\tsourceTree = "<group>";')
-output.append('\t\t};')
-output.append(f'\t\t{products_group_id} /* Products */ = {{')
-output.append('\t\t\tisa = PBXGroup;')
-output.append('\t\t\tchildren = (')
-output.append(f'\t\t\t\t{app_ref_id} /* Tonic.app */,')
-output.append('\t\t\t);')
-output.append('\t\t\tname = Products;')
-output.append('\t\t\tsourceTree = "<group>";')
-output.append('\t\t};')
-output.append(f'\t\t{generate_uuid("tonicgroup")} /* Tonic */ = {{')
-output.append('\t\t\tisa = PBXGroup;')
-output.append('\t\t\tchildren = (')
-
-# Add subgroups
-models_group = generate_uuid('models')
-views_group = generate_uuid('views')
-utils_group = generate_uuid('utils')
-services_group = generate_uuid('services')
-design_group = generate_uuid('design')
-output.append(f'\t\t\t\t{models_group} /* Models */,')
-output.append(f'\t\t\t\t{views_group} /* Views */,')
-output.append(f'\t\t\t\t{utils_group} /* Utilities */,')
-output.append(f'\t\t\t\t{services_group} /* Services */,')
-output.append(f'\t\t\t\t{design_group} /* Design */,')
-
-# Add top-level files
-for f in swift_files:
-    parts = f.split('/')
-    if len(parts) == 2 and parts[0] == 'Tonic':
-        # Top level file
-        fname = parts[1]
-        output.append(f'\t\t\t\t{file_refs[f]} /* {fname} */,')
-output.append('\t\t\t);')
-output.append('\t\t\tpath = Tonic;')
-output.append('\t\t\tsourceTree = "<group>";')
-output.append('\t\t};')
-
-# Models group
-output.append(f'\t\t{models_group} /* Models */ = {{')
-output.append('\t\t\tisa = PBXGroup;')
-output.append('\t\t\tchildren = (')
-for f in swift_files:
-    if '/Models/' in f:
-        output.append(f'\t\t\t\t{file_refs[f]} /* {os.path.basename(f)} */,')
-output.append('\t\t\t);')
-output.append('\t\t\tpath = Models;')
-output.append('\t\t\tsourceTree = "<group>";')
-output.append('\t\t};')
-
-# Views group
-output.append(f'\t\t{views_group} /* Views */ = {{')
-output.append('\t\t\tisa = PBXGroup;')
-output.append('\t\t\tchildren = (')
-for f in swift_files:
-    if '/Views/' in f:
-        output.append(f'\t\t\t\t{file_refs[f]} /* {os.path.basename(f)} */,')
-output.append('\t\t\t);')
-output.append('\t\t\tpath = Views;')
-output.append('\t\t\tsourceTree = "<group>";')
-output.append('\t\t};')
-
-# Utilities group
-output.append(f'\t\t{utils_group} /* Utilities */ = {{')
-output.append('\t\t\tisa = PBXGroup;')
-output.append('\t\t\tchildren = (')
-for f in swift_files:
-    if '/Utilities/' in f:
-        output.append(f'\t\t\t\t{file_refs[f]} /* {os.path.basename(f)} */,')
-output.append('\t\t\t);')
-output.append('\t\t\tpath = Utilities;')
-output.append('\t\t\tsourceTree = "<group>";')
-output.append('\t\t};')
-
-# Services group
-output.append(f'\t\t{services_group} /* Services */ = {{')
-output.append('\t\t\tisa = PBXGroup;')
-output.append('\t\t\tchildren = (')
-for f in swift_files:
-    if '/Services/' in f:
-        output.append(f'\t\t\t\t{file_refs[f]} /* {os.path.basename(f)} */,')
-output.append('\t\t\t);')
-output.append('\t\t\tpath = Services;')
-output.append('\t\t\tsourceTree = "<group>";')
-output.append('\t\t};')
-
-# Design group
-output.append(f'\t\t{design_group} /* Design */ = {{')
-output.append('\t\t\tisa = PBXGroup;')
-output.append('\t\t\tchildren = (')
-for f in swift_files:
-    if '/Design/' in f:
-        output.append(f'\t\t\t\t{file_refs[f]} /* {os.path.basename(f)} */,')
-output.append('\t\t\t);')
-output.append('\t\t\tpath = Design;')
-output.append('\t\t\tsourceTree = "<group>";')
-output.append('\t\t};')
-
-output.append('/* End PBXGroup section */')
-
-# PBXNativeTarget
-output.append('/* Begin PBXNativeTarget section */')
-output.append(f'\t\t{target_id} /* Tonic */ = {{')
-output.append('\t\t\tisa = PBXNativeTarget;')
-output.append(f'\t\t\tbuildConfigurationList = {target_config_list_id} /* Build configuration list for PBXNativeTarget "Tonic" */;')
-output.append('\t\t\tbuildPhases = (')
-output.append(f'\t\t\t\t{sources_phase_id} /* Sources */,')
-output.append(f'\t\t\t\t{frameworks_phase_id} /* Frameworks */,')
-output.append(f'\t\t\t\t{resources_phase_id} /* Resources */,')
-output.append('\t\t\t);')
-output.append('\t\t\tbuildRules = (')
-output.append('\t\t\t);')
-output.append('\t\t\tdependencies = (')
-output.append('\t\t\t);')
-output.append('\t\t\tname = Tonic;')
-output.append('\t\t\tproductName = Tonic;')
-output.append(f'\t\t\tproductReference = {app_ref_id} /* Tonic.app */;')
-output.append('\t\t\tproductType = "com.apple.product-type.application";')
-output.append('\t\t};')
-output.append('/* End PBXNativeTarget section */')
-
-# PBXProject
-output.append('/* Begin PBXProject section */')
-output.append(f'\t\t{project_id} /* Project object */ = {{')
-output.append('\t\t\tisa = PBXProject;')
-output.append('\t\t\tattributes = {')
-output.append('\t\t\t\tBuildIndependentTargetsInParallel = 1;')
-output.append('\t\t\t\tLastSwiftUpdateCheck = 1500;')
-output.append('\t\t\t\tLastUpgradeCheck = 1500;')
-output.append('\t\t\t\tTargetAttributes = {')
-output.append(f'\t\t\t\t\t{target_id} = {{')
-output.append('\t\t\t\t\t\tCreatedOnToolsVersion = 15.0;')
-output.append('\t\t\t\t\t\tSystemCapabilities = {')
-output.append('\t\t\t\t\t\t\tcom.apple.Sandbox = {')
-output.append('\t\t\t\t\t\t\t\tenabled = 0;')
-output.append('\t\t\t\t\t\t\t};')
-output.append('\t\t\t\t\t\t};')
-output.append('\t\t\t\t\t};')
-output.append('\t\t\t\t};')
-output.append('\t\t\t};')
-output.append(f'\t\t\tbuildConfigurationList = {config_list_id} /* Build configuration list for PBXProject "Tonic" */;')
-output.append('\t\t\tcompatibilityVersion = "Xcode 14.0";')
-output.append('\t\t\tdevelopmentRegion = en;')
-output.append('\t\t\thasScannedForEncodings = 0;')
-output.append('\t\t\tknownRegions = (')
-output.append('\t\t\t\ten,')
-output.append('\t\t\t\tBase,')
-output.append('\t\t\t);')
-output.append(f'\t\t\tmainGroup = {main_group_id};')
-output.append(f'\t\t\tproductRefGroup = {products_group_id};')
-output.append('\t\t\tprojectDirPath = "";')
-output.append('\t\t\tprojectRoot = "";')
-output.append('\t\t\ttargets = (')
-output.append(f'\t\t\t\t{target_id} /* Tonic */,')
-output.append('\t\t\t);')
-output.append('\t\t};')
-output.append('/* End PBXProject section */')
-
-# PBXResourcesBuildPhase
-output.append('/* Begin PBXResourcesBuildPhase section */')
-output.append(f'\t\t{resources_phase_id} /* Resources */ = {{')
-output.append('\t\t\tisa = PBXResourcesBuildPhase;')
-output.append('\t\t\tbuildActionMask = 2147483647;')
-output.append('\t\t\tfiles = (')
-output.append('\t\t\t);')
-output.append('\t\t\trunOnlyForDeploymentPostprocessing = 0;')
-output.append('\t\t};')
-output.append('/* End PBXResourcesBuildPhase section */')
-
-# PBXSourcesBuildPhase
-output.append('/* Begin PBXSourcesBuildPhase section */')
-output.append(f'\t\t{sources_phase_id} /* Sources */ = {{')
-output.append('\t\t\tisa = PBXSourcesBuildPhase;')
-output.append('\t\t\tbuildActionMask = 2147483647;')
-output.append('\t\t\tfiles = (')
-for f in swift_files:
-    output.append(f'\t\t\t\t{build_files[f]} /* {os.path.basename(f)} in Sources */,')
-output.append('\t\t\t);')
-output.append('\t\t\trunOnlyForDeploymentPostprocessing = 0;')
-output.append('\t\t};')
-output.append('/* End PBXSourcesBuildPhase section */')
-
-# XCBuildConfiguration
-output.append('/* Begin XCBuildConfiguration section */')
-
-# Debug config
-output.append(f'\t\t{generate_uuid("debug_proj")} /* Debug */ = {{')
-output.append('\t\t\tisa = XCBuildConfiguration;')
-output.append('\t\t\tbuildSettings = {')
-output.append('\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;')
-output.append('\t\t\t\tASSETCATALOG_COMPILER_GENERATE_SWIFT_ASSET_SYMBOL_EXTENSIONS = YES;')
-output.append('\t\t\t\tCLANG_ANALYZER_NONNULL = YES;')
-output.append('\t\t\t\tCLANG_CXX_LANGUAGE_STANDARD = "gnu++20";')
-output.append('\t\t\t\tCLANG_ENABLE_MODULES = YES;')
-output.append('\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;')
-output.append('\t\t\t\tCLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;')
-output.append('\t\t\t\tCOPY_PHASE_STRIP = NO;')
-output.append('\t\t\t\tDEBUG_INFORMATION_FORMAT = dwarf;')
-output.append('\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;')
-output.append('\t\t\t\tENABLE_TESTABILITY = YES;')
-output.append('\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu17;')
-output.append('\t\t\t\tGCC_NO_COMMON_BLOCKS = YES;')
-output.append('\t\t\t\tGCC_WARN_64_TO_32_BIT_CONVERSION = YES;')
-output.append('\t\t\t\tGCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;')
-output.append('\t\t\t\tGCC_WARN_UNDECLARED_SELECTOR = YES;')
-output.append('\t\t\t\tMACOSX_DEPLOYMENT_TARGET = 14.0;')
-output.append('\t\t\t\tMTL_ENABLE_DEBUG_INFO = INCLUDE_SOURCE;')
-output.append('\t\t\t\tONLY_ACTIVE_ARCH = YES;')
-output.append('\t\t\t\tSDKROOT = macosx;')
-output.append('\t\t\t\tSWIFT_ACTIVE_COMPILATION_CONDITIONS = "DEBUG $(inherited)";')
-output.append('\t\t\t\tSWIFT_OPTIMIZATION_LEVEL = "-Onone";')
-output.append('\t\t\t};')
-output.append('\t\t\tname = Debug;')
-output.append('\t\t};')
-
-# Release config
-output.append(f'\t\t{generate_uuid("release_proj")} /* Release */ = {{')
-output.append('\t\t\tisa = XCBuildConfiguration;')
-output.append('\t\t\tbuildSettings = {')
-output.append('\t\t\t\tALWAYS_SEARCH_USER_PATHS = NO;')
-output.append('\t\t\t\tASSETCATALOG_COMPILER_GENERATE_SWIFT_ASSET_SYMBOL_EXTENSIONS = YES;')
-output.append('\t\t\t\tCLANG_ANALYZER_NONNULL = YES;')
-output.append('\t\t\t\tCLANG_CXX_LANGUAGE_STANDARD = "gnu++20";')
-output.append('\t\t\t\tCLANG_ENABLE_MODULES = YES;')
-output.append('\t\t\t\tCLANG_ENABLE_OBJC_ARC = YES;')
-output.append('\t\t\t\tCLANG_WARN_UNGUARDED_AVAILABILITY = YES_AGGRESSIVE;')
-output.append('\t\t\t\tCOPY_PHASE_STRIP = NO;')
-output.append('\t\t\t\tDEBUG_INFORMATION_FORMAT = "dwarf-with-dsym";')
-output.append('\t\t\t\tENABLE_NS_ASSERTIONS = NO;')
-output.append('\t\t\t\tENABLE_STRICT_OBJC_MSGSEND = YES;')
-output.append('\t\t\t\tGCC_C_LANGUAGE_STANDARD = gnu17;')
-output.append('\t\t\t\tGCC_NO_COMMON_BLOCKS = YES;')
-output.append('\t\t\t\tGCC_WARN_64_TO_32_BIT_CONVERSION = YES;')
-output.append('\t\t\t\tGCC_WARN_ABOUT_RETURN_TYPE = YES_ERROR;')
-output.append('\t\t\t\tGCC_WARN_UNDECLARED_SELECTOR = YES;')
-output.append('\t\t\t\tMACOSX_DEPLOYMENT_TARGET = 14.0;')
-output.append('\t\t\t\tMTL_ENABLE_DEBUG_INFO = NO;')
-output.append('\t\t\t\tSDKROOT = macosx;')
-output.append('\t\t\t\tSWIFT_COMPILATION_MODE = wholemodule;')
-output.append('\t\t\t};')
-output.append('\t\t\tname = Release;')
-output.append('\t\t};')
-
-# Target Debug config
-output.append(f'\t\t{generate_uuid("debug_target")} /* Debug */ = {{')
-output.append('\t\t\tisa = XCBuildConfiguration;')
-output.append('\t\t\tbuildSettings = {')
-output.append('\t\t\t\tASSETCATALOG_COMPILER_APPICON_NAME = AppIcon;')
-output.append('\t\t\t\tASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME = AccentColor;')
-output.append('\t\t\t\tCODE_SIGN_ENTITLEMENTS = Tonic/Tonic.entitlements;')
-output.append('\t\t\t\tCODE_SIGN_STYLE = Automatic;')
-output.append('\t\t\t\tCOMBINE_HIDPI_IMAGES = YES;')
-output.append('\t\t\t\tCURRENT_PROJECT_VERSION = 1;')
-output.append('\t\t\t\tDEVELOPMENT_TEAM = "";')
-output.append('\t\t\t\tENABLE_HARDENED_RUNTIME = NO;')
-output.append('\t\t\t\tENABLE_PREVIEWS = YES;')
-output.append('\t\t\t\tGENERATE_INFOPLIST_FILE = YES;')
-output.append('\t\t\t\tINFOPLIST_KEY_CFBundleDisplayName = "Tonic for Mac";')
-output.append('\t\t\t\tINFOPLIST_KEY_LSApplicationCategoryType = "public.app-category.utilities";')
-output.append('\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = "";')
-output.append('\t\t\t\tLD_RUNPATH_SEARCH_PATHS = (')
-output.append('\t\t\t\t\t"$(inherited)",')
-output.append('\t\t\t\t\t"@executable_path/../Frameworks",')
-output.append('\t\t\t\t);')
-output.append('\t\t\t\tMACOSX_DEPLOYMENT_TARGET = 14.0;')
-output.append('\t\t\t\tMARKETING_VERSION = 0.1.0;')
-output.append('\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = com.tonicformac.app;')
-output.append('\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME)";')
-output.append('\t\t\t\tSDKROOT = macosx;')
-output.append('\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;')
-output.append('\t\t\t\tSWIFT_VERSION = 5.0;')
-output.append('\t\t\t};')
-output.append('\t\t\tname = Debug;')
-output.append('\t\t};')
-
-# Target Release config
-output.append(f'\t\t{generate_uuid("release_target")} /* Release */ = {{')
-output.append('\t\t\tisa = XCBuildConfiguration;')
-output.append('\t\t\tbuildSettings = {')
-output.append('\t\t\t\tASSETCATALOG_COMPILER_APPICON_NAME = AppIcon;')
-output.append('\t\t\t\tASSETCATALOG_COMPILER_GLOBAL_ACCENT_COLOR_NAME = AccentColor;')
-output.append('\t\t\t\tCODE_SIGN_ENTITLEMENTS = Tonic/Tonic.entitlements;')
-output.append('\t\t\t\tCODE_SIGN_STYLE = Automatic;')
-output.append('\t\t\t\tCOMBINE_HIDPI_IMAGES = YES;')
-output.append('\t\t\t\tCURRENT_PROJECT_VERSION = 1;')
-output.append('\t\t\t\tDEVELOPMENT_TEAM = "";')
-output.append('\t\t\t\tENABLE_HARDENED_RUNTIME = NO;')
-output.append('\t\t\t\tENABLE_PREVIEWS = YES;')
-output.append('\t\t\t\tGENERATE_INFOPLIST_FILE = YES;')
-output.append('\t\t\t\tINFOPLIST_KEY_CFBundleDisplayName = "Tonic for Mac";')
-output.append('\t\t\t\tINFOPLIST_KEY_LSApplicationCategoryType = "public.app-category.utilities";')
-output.append('\t\t\t\tINFOPLIST_KEY_NSHumanReadableCopyright = "";')
-output.append('\t\t\t\tLD_RUNPATH_SEARCH_PATHS = (')
-output.append('\t\t\t\t\t"$(inherited)",')
-output.append('\t\t\t\t\t"@executable_path/../Frameworks",')
-output.append('\t\t\t\t);')
-output.append('\t\t\t\tMACOSX_DEPLOYMENT_TARGET = 14.0;')
-output.append('\t\t\t\tMARKETING_VERSION = 0.1.0;')
-output.append('\t\t\t\tPRODUCT_BUNDLE_IDENTIFIER = com.tonicformac.app;')
-output.append('\t\t\t\tPRODUCT_NAME = "$(TARGET_NAME)";')
-output.append('\t\t\t\tSDKROOT = macosx;')
-output.append('\t\t\t\tSWIFT_EMIT_LOC_STRINGS = YES;')
-output.append('\t\t\t\tSWIFT_VERSION = 5.0;')
-output.append('\t\t\t};')
-output.append('\t\t\tname = Release;')
-output.append('\t\t};')
-
-output.append('/* End XCBuildConfiguration section */')
-
-# XCConfigurationList sections
-output.append('/* Begin XCConfigurationList section */')
-output.append(f'\t\t{config_list_id} /* Build configuration list for PBXProject "Tonic" */ = {{')
-output.append('\t\t\tisa = XCConfigurationList;')
-output.append('\t\t\tbuildConfigurations = (')
-output.append(f'\t\t\t\t{generate_uuid("debug_proj")} /* Debug */,')
-output.append(f'\t\t\t\t{generate_uuid("release_proj")} /* Release */,')
-output.append('\t\t\t);')
-output.append('\t\t\tdefaultConfigurationIsVisible = 0;')
-output.append('\t\t\tdefaultConfigurationName = Release;')
-output.append('\t\t};')
-output.append(f'\t\t{target_config_list_id} /* Build configuration list for PBXNativeTarget "Tonic" */ = {{')
-output.append('\t\t\tisa = XCConfigurationList;')
-output.append('\t\t\tbuildConfigurations = (')
-output.append(f'\t\t\t\t{generate_uuid("debug_target")} /* Debug */,')
-output.append(f'\t\t\t\t{generate_uuid("release_target")} /* Release */,')
-output.append('\t\t\t);')
-output.append('\t\t\tdefaultConfigurationIsVisible = 0;')
-output.append('\t\t\tdefaultConfigurationName = Release;')
-output.append('\t\t};')
-output.append('/* End XCConfigurationList section */')
-
-output.append('\t};')
-output.append('\trootObject = ' + project_id + ' /* Project object */;')
-output.append('}')
-
-# Write to file
-os.makedirs('Tonic.xcodeproj', exist_ok=True)
-with open('Tonic.xcodeproj/project.pbxproj', 'w') as f:
-    f.write('\n'.join(output))
+    fh.writelines(f'\t\t{file_refs[f]} /* {name} */ = {{isa = PBXFileReference; lastKnownFileType = sourcecode.swift; path = "{name}"; sourceTree = "<group>"; }};\n' for f, name, _ in swift_files)
+    w('/* End PBXFileReference section */\n')
+
+    # PBXFrameworksBuildPhase
+    w(FRAMEWORKS_PHASE_SECTION.format(frameworks_phase_id=frameworks_phase_id))
+
+    # PBXGroup section
+    w(GROUP_SECTION_HEAD.format(
+        main_group_id=main_group_id,
+        tonic_group_id=tonic_group_id,
+        products_group_id=products_group_id,
+        app_ref_id=app_ref_id,
+        models_group=models_group,
+        views_group=views_group,
+        utils_group=utils_group,
+        services_group=services_group,
+        design_group=design_group
+    ))
+
+    # Add top-level files
+    fh.writelines(f'\t\t\t\t{file_refs[f]} /* {name} */,\n' for f, name in groups['_top'])
+    w(TONIC_GROUP_TAIL)
+
+    # Subgroups
+    emit_group(fh, models_group, 'Models', groups['Models'], file_refs)
+    emit_group(fh, views_group, 'Views', groups['Views'], file_refs)
+    emit_group(fh, utils_group, 'Utilities', groups['Utilities'], file_refs)
+    emit_group(fh, services_group, 'Services', groups['Services'], file_refs)
+    emit_group(fh, design_group, 'Design', groups['Design'], file_refs)
+
+    w('/* End PBXGroup section */\n')
+
+    # PBXNativeTarget
+    w(NATIVE_TARGET_SECTION.format(
+        target_id=target_id,
+        target_config_list_id=target_config_list_id,
+        sources_phase_id=sources_phase_id,
+        frameworks_phase_id=frameworks_phase_id,
+        resources_phase_id=resources_phase_id,
+        app_ref_id=app_ref_id
+    ))
+
+    # PBXProject
+    w(PROJECT_SECTION.format(
+        project_id=project_id,
+        target_id=target_id,
+        config_list_id=config_list_id,
+        main_group_id=main_group_id,
+        products_group_id=products_group_id
+    ))
+
+    # PBXResourcesBuildPhase
+    w(RESOURCES_PHASE_SECTION.format(resources_phase_id=resources_phase_id))
+
+    # PBXSourcesBuildPhase
+    w(SOURCES_PHASE_HEAD.format(sources_phase_id=sources_phase_id))
+    fh.writelines(f'\t\t\t\t{build_files[f]} /* {name} in Sources */,\n' for f, name, _ in swift_files)
+    w(SOURCES_PHASE_TAIL)
+
+    # XCBuildConfiguration
+    w('/* Begin XCBuildConfiguration section */\n')
+
+    # Debug config
+    w(DEBUG_PROJ_CFG.format(uuid=debug_proj_id))
+
+    # Release config
+    w(RELEASE_PROJ_CFG.format(uuid=release_proj_id))
+
+    # Target Debug config
+    w(DEBUG_TARGET_CFG.format(uuid=debug_target_id))
+
+    # Target Release config
+    w(RELEASE_TARGET_CFG.format(uuid=release_target_id))
+
+    w('/* End XCBuildConfiguration section */\n')
+
+    # XCConfigurationList sections
+    w(CONFIG_LISTS_SECTION.format(
+        config_list_id=config_list_id,
+        debug_proj_id=debug_proj_id,
+        release_proj_id=release_proj_id,
+        target_config_list_id=target_config_list_id,
+        debug_target_id=debug_target_id,
+        release_target_id=release_target_id
+    ))
+
+    w(FILE_FOOTER.format(project_id=project_id))
+
+with open(SIG_PATH, 'w') as f:
+    f.write(sig + '\n' + hash_file(PBXPROJ_PATH) + '\n')
 
 print("Created project.pbxproj with " + str(len(swift_files)) + " Swift files")